@@ -15,9 +15,19 @@ Collate a project’s text source files into a single Markdown document.
 """
 
 import argparse
+import json
+import multiprocessing
 import os
+import queue
 import sys
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
+from typing import BinaryIO, NamedTuple
 
 # ---- Configuration: default directory excludes typical for Godot + Rust ----
 DEFAULT_EXCLUDED_DIRS = {
@@ -54,6 +64,25 @@ DEFAULT_ALLOWED_EXTENSIONS = {
     ".txt", ".csv", ".gitattributes", ".gitignore", ".editorconfig",
 }
 
+# ---- Directory scanning threads; opendir/stat latency dominates on NFS and deep trees ----
+DEFAULT_WALK_WORKERS = 16
+
+# ---- File reading threads; reads release the GIL, so cold-cache I/O overlaps ----
+DEFAULT_READ_WORKERS = 16
+
+# ---- Files handed to a read thread per task, capped by count and by total bytes ----
+READ_BATCH_FILES = 16
+READ_BATCH_BYTES = 256 * 1024
+
+# ---- Output is streamed per file through one buffered binary writer ----
+OUTPUT_BUFFER_BYTES = 1 << 20
+
+# ---- With --split, files directly under the root are written under this partition name ----
+ROOT_PARTITION = "_root"
+
+# ---- Bump when the --cache file layout or the meaning of cached text changes ----
+CACHE_VERSION = 2
+
 # ---- Map extension -> Markdown code fence language tag ----
 LANG_FROM_EXTENSION = {
     ".gd": "gdscript",
@@ -93,71 +122,405 @@ LANG_FROM_EXTENSION = {
     ".editorconfig": "",
 }
 
-def is_probably_binary(file_path: Path, sample_bytes: int = 8192) -> bool:
-    """Heuristic: read some bytes and look for NULs or high binary density."""
-    try:
-        with open(file_path, "rb") as file_handle:
-            chunk = file_handle.read(sample_bytes)
-        if b"\x00" in chunk:
-            return True
-        if not chunk:
-            return False
-        control_bytes = sum(b < 9 or (13 < b < 32) for b in chunk)
-        return (control_bytes / len(chunk)) > 0.30
-    except Exception:
-        return True
+# ---- Dotfiles still collected when hidden files are skipped ----
+_HIDDEN_ALLOWED = frozenset({".gitignore", ".gitattributes", ".editorconfig"})
+
+# ---- Scanning a directory fd lets DirEntry.stat() use fstatat instead of re-resolving full paths (POSIX) ----
+_SCANDIR_ACCEPTS_FD = os.scandir in os.supports_fd
 
-def infer_lang_from_extension(file_path: Path) -> str:
-    return LANG_FROM_EXTENSION.get(file_path.suffix.lower(), "")
+# ---- Leading bytes of each file inspected by the binary heuristic ----
+BINARY_SAMPLE_BYTES = 8192
 
-def should_include_file(file_path: Path, allowed_extensions: set[str]) -> bool:
-    if file_path.suffix.lower() in allowed_extensions:
+# ---- Byte classes for the binary heuristic: NUL -> 2, other control bytes (not tab/newlines/etc.) -> 1, text -> 0 ----
+_BYTE_CLASS_TABLE = bytes.maketrans(
+    bytes(range(256)),
+    bytes(2 if b == 0 else 1 if (b < 9 or 13 < b < 32) else 0 for b in range(256)),
+)
+
+class CollectedFile(NamedTuple):
+    path: str
+    relative_path: str
+    suffix: str
+    size: int
+    mtime_ns: int
+
+def is_probably_binary(chunk: bytes) -> bool:
+    """Heuristic: look for NULs or high binary density in a leading sample of a file."""
+    if not chunk:
+        return False
+    classified = chunk.translate(_BYTE_CLASS_TABLE)
+    if b"\x02" in classified:
         return True
-    return False
+    control_bytes = classified.count(b"\x01")
+    return (control_bytes / len(chunk)) > 0.30
 
 def walk_project(
     root_dir: Path,
     excluded_directories: set[str],
     allowed_extensions: set[str],
     include_hidden: bool,
-) -> list[Path]:
-    collected_paths: list[Path] = []
-    for current_dir, dirnames, filenames in os.walk(root_dir):
-        current_path = Path(current_dir)
-
-        pruned_dirnames = []
-        for directory_name in dirnames:
-            if directory_name in excluded_directories:
-                continue
-            if not include_hidden and directory_name.startswith("."):
-                continue
-            pruned_dirnames.append(directory_name)
-        dirnames[:] = pruned_dirnames
+    workers: int = DEFAULT_WALK_WORKERS,
+) -> list[CollectedFile]:
+    """Breadth-first scan of root_dir, with a pool of threads each running os.scandir."""
+    excluded = frozenset(excluded_directories)
+    allowed = frozenset(allowed_extensions)
+    skip_hidden = not include_hidden
+    collected_files: list[CollectedFile] = []
+    # (absolute dir, dir relative to root_dir); relative paths are built during the walk.
+    pending_dirs: queue.Queue[tuple[str, str] | None] = queue.Queue()
+    stop_scanning = threading.Event()
 
-        for filename in filenames:
-            file_path = current_path / filename
-            if not include_hidden and filename.startswith(".") and file_path.suffix not in {".gitignore", ".gitattributes", ".editorconfig"}:
-                continue
-            if should_include_file(file_path, allowed_extensions):
-                collected_paths.append(file_path)
+    def scan_pending_dirs() -> None:
+        while True:
+            pending = pending_dirs.get()
+            if pending is None or stop_scanning.is_set():
+                pending_dirs.task_done()
+                return
+            current_dir, relative_dir = pending
+            dir_fd = -1
+            try:
+                if _SCANDIR_ACCEPTS_FD:
+                    dir_fd = os.open(current_dir, os.O_RDONLY | os.O_DIRECTORY)
+                    entries = os.scandir(dir_fd)
+                else:
+                    entries = os.scandir(current_dir)
+                with entries:
+                    for entry in entries:
+                        name = entry.name
+                        # One hidden-name test per entry, shared by the directory and file branches.
+                        hidden = skip_hidden and name[:1] == "."
+                        try:
+                            # Symlinked directories are not followed, matching os.walk.
+                            if entry.is_dir(follow_symlinks=False):
+                                if hidden or name in excluded:
+                                    continue
+                                pending_dirs.put((os.path.join(current_dir, name), os.path.join(relative_dir, name)))
+                                continue
+                            if not entry.is_file():
+                                continue
+                            if hidden and name not in _HIDDEN_ALLOWED:
+                                continue
+                            # Lowercased extension by plain string scan; dotfiles like ".gitignore" are their own suffix.
+                            dot = name.rfind(".")
+                            if dot < 0:
+                                continue
+                            suffix = name[dot:].lower()
+                            if suffix not in allowed:
+                                continue
+                            file_stat = entry.stat()
+                            # list.append is atomic under the GIL.
+                            collected_files.append(
+                                CollectedFile(
+                                    os.path.join(current_dir, name),
+                                    os.path.join(relative_dir, name),
+                                    suffix,
+                                    file_stat.st_size,
+                                    file_stat.st_mtime_ns,
+                                )
+                            )
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            finally:
+                if dir_fd >= 0:
+                    os.close(dir_fd)
+                pending_dirs.task_done()
 
-    collected_paths.sort(key=lambda p: str(p).lower())
-    return collected_paths
+    pending_dirs.put((str(root_dir), ""))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for _ in range(workers):
+                executor.submit(scan_pending_dirs)
+            pending_dirs.join()
+        except BaseException:
+            # e.g. Ctrl-C: workers abandon the remaining queue instead of finishing the walk.
+            stop_scanning.set()
+            raise
+        finally:
+            # Wake every worker blocked in get() so the executor can shut down.
+            for _ in range(workers):
+                pending_dirs.put(None)
 
-def read_text_safely(file_path: Path, max_bytes: int) -> str | None:
-    """Return file content as text (UTF-8 with replacement) if under size and not binary."""
+    # Decorate-sort-undecorate: build each lowercase key once instead of per comparison.
+    # Scan order depends on thread timing, so case-only ties fall back to the exact path.
+    decorated = [(f.path.lower(), f.path, f) for f in collected_files]
+    decorated.sort(key=itemgetter(0, 1))
+    return [f for _, _, f in decorated]
+
+def read_text_safely(file_path: str, max_bytes: int) -> tuple[bytes | None, int]:
+    """Return (UTF-8 content without trailing newlines, size); content is None if too large or probably binary."""
     try:
-        if file_path.stat().st_size > max_bytes:
-            return None
-        if is_probably_binary(file_path):
-            return None
-        return file_path.read_text(encoding="utf-8", errors="replace")
+        with open(file_path, "rb") as file_handle:
+            file_size = os.fstat(file_handle.fileno()).st_size
+            if file_size > max_bytes:
+                return None, file_size
+            data = file_handle.read(max_bytes + 1)
     except Exception:
-        return None
+        return None, 0
+    file_size = len(data)
+    if file_size > max_bytes:
+        return None, file_size
+    if is_probably_binary(data[:BINARY_SAMPLE_BYTES]):
+        return None, file_size
+    # Universal newlines, as text-mode reading gave: CRLF and bare CR both become LF.
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    data = data.rstrip(b"\n")
+    # Newlines are normalised above for both paths. Pure-ASCII content is already valid UTF-8;
+    # anything else goes through replacement decoding.
+    if not data.isascii():
+        data = data.decode("utf-8", errors="replace").encode("utf-8")
+    return data, file_size
+
+# path -> [mtime_ns, size, text or None for a binary file]
+CacheEntries = dict[str, list]
+
+def cache_path_for(output_file: Path) -> Path:
+    return output_file.with_name(f".{output_file.stem}.cache.json")
+
+def load_cache(cache_file: Path, max_bytes: int) -> CacheEntries:
+    """Load cached read results; anything unreadable or built with another size cap is ignored."""
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(cached, dict) or cached.get("version") != CACHE_VERSION or cached.get("max_bytes") != max_bytes:
+        return {}
+    files = cached.get("files")
+    if not isinstance(files, dict):
+        return {}
+    # Malformed entries are dropped here so they simply miss on lookup.
+    return {path: entry for path, entry in files.items() if is_valid_cache_entry(entry)}
+
+def is_valid_cache_entry(entry: object) -> bool:
+    return (
+        isinstance(entry, list)
+        and len(entry) == 3
+        and type(entry[0]) is int
+        and type(entry[1]) is int
+        and (entry[2] is None or isinstance(entry[2], str))
+    )
+
+def save_cache(cache_file: Path, max_bytes: int, entries: CacheEntries) -> None:
+    payload = {"version": CACHE_VERSION, "max_bytes": max_bytes, "files": entries}
+    try:
+        cache_file.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    except OSError as error:
+        print(f"Warning: could not write cache {cache_file}: {error}", file=sys.stderr)
+
+def lookup_cache(cache: CacheEntries, collected_file: CollectedFile) -> list | None:
+    entry = cache.get(collected_file.path)
+    if entry is not None and entry[0] == collected_file.mtime_ns and entry[1] == collected_file.size:
+        return entry
+    return None
+
+def read_cached_or_safely(
+    collected_file: CollectedFile,
+    max_bytes: int,
+    cache: CacheEntries,
+) -> tuple[bytes | None, int]:
+    """read_text_safely, short-circuited by a cache entry whose mtime and size still match."""
+    entry = lookup_cache(cache, collected_file)
+    if entry is None:
+        return read_text_safely(collected_file.path, max_bytes)
+    text = entry[2]
+    return (None if text is None else text.encode("utf-8")), entry[1]
+
+def batch_for_reading(collected_files: Iterable[CollectedFile]) -> Iterator[list[CollectedFile]]:
+    """Group files into read tasks capped by both file count and total size."""
+    batch: list[CollectedFile] = []
+    batch_bytes = 0
+    for collected_file in collected_files:
+        batch.append(collected_file)
+        batch_bytes += collected_file.size
+        if len(batch) >= READ_BATCH_FILES or batch_bytes >= READ_BATCH_BYTES:
+            yield batch
+            batch = []
+            batch_bytes = 0
+    if batch:
+        yield batch
+
+def read_batch(
+    batch: list[CollectedFile],
+    max_bytes: int,
+    cache: CacheEntries,
+) -> list[tuple[bytes | None, int]]:
+    return [read_cached_or_safely(collected_file, max_bytes, cache) for collected_file in batch]
+
+def read_files_in_order(
+    collected_files: Iterable[CollectedFile],
+    max_bytes: int,
+    cache: CacheEntries | None = None,
+    workers: int = DEFAULT_READ_WORKERS,
+) -> Iterator[tuple[bytes | None, int]]:
+    """
+    Yield read results in input order while worker threads read ahead.
+    Files are read in small batches so the per-task Future overhead is paid per batch
+    rather than per file. Only a bounded window of batches is in flight, so memory stays
+    proportional to the worker count rather than the project size.
+    """
+    if cache is None:
+        cache = {}
+    window = workers * 2
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight: deque[Future[list[tuple[bytes | None, int]]]] = deque()
+        for batch in batch_for_reading(collected_files):
+            in_flight.append(executor.submit(read_batch, batch, max_bytes, cache))
+            if len(in_flight) >= window:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
 
 def human_kilobytes(num_bytes: int) -> str:
     return f"{num_bytes/1024:.1f} KB"
 
+class CollationCounts(NamedTuple):
+    included: int
+    skipped_for_size: int
+    skipped_as_binary: int
+
+@contextmanager
+def atomic_output(output_file: Path) -> Iterator[BinaryIO]:
+    """Write to a sibling temp file and move it over output_file only once it is complete."""
+    temporary_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary_file, "wb", buffering=OUTPUT_BUFFER_BYTES) as output_stream:
+            yield output_stream
+        os.replace(temporary_file, output_file)
+    except BaseException:
+        temporary_file.unlink(missing_ok=True)
+        raise
+
+def collation_header(project_root: Path, file_count: int, max_kb: int, section_title: str) -> str:
+    return (
+        "# Project Context Collation\n\n"
+        f"- Root: `{project_root}`\n"
+        f"- File count scanned (pre-size/binary filter): {file_count}\n"
+        f"- Max file size included: {max_kb} KB\n"
+        "\n"
+        f"## {section_title}\n"
+        "\n"
+    )
+
+def collation_footer(counts: CollationCounts) -> str:
+    return (
+        "\n---\n"
+        f"Included files: {counts.included}\n"
+        f"Skipped (too large): {counts.skipped_for_size}\n"
+        f"Skipped (binary/non-text): {counts.skipped_as_binary}\n"
+    )
+
+def write_collation(
+    output_file: Path,
+    project_root: Path,
+    collected_files: list[CollectedFile],
+    max_kb: int,
+    cache: CacheEntries | None = None,
+    read_workers: int = DEFAULT_READ_WORKERS,
+) -> tuple[CollationCounts, CacheEntries]:
+    """
+    Stream one Markdown collation of collected_files to output_file.
+    Returns the counts and, when a cache is given, the cache entries for these files.
+    """
+    maximum_bytes = max_kb * 1024
+    updated_cache: CacheEntries = {}
+
+    included_count = 0
+    skipped_for_size = 0
+    skipped_as_binary = 0
+
+    with atomic_output(output_file) as output_stream:
+        write = output_stream.write
+        write(collation_header(project_root, len(collected_files), max_kb, "Table of Contents").encode("utf-8"))
+
+        table_of_contents = "".join(
+            f"- `{f.relative_path}` ({human_kilobytes(f.size)})\n" for f in collected_files
+        )
+        write(table_of_contents.encode("utf-8"))
+        write(b"\n---\n\n")
+
+        read_results = read_files_in_order(
+            collected_files,
+            max_bytes=maximum_bytes,
+            cache=cache,
+            workers=read_workers,
+        )
+        for collected_file, (content, file_size) in zip(collected_files, read_results):
+            file_path = collected_file.path
+            relative_path = collected_file.relative_path
+            if cache is not None:
+                entry = lookup_cache(cache, collected_file)
+                if entry is None and file_size == collected_file.size and 0 < file_size <= maximum_bytes:
+                    # Read errors report size 0, so only genuine text/binary results are cached.
+                    entry = [collected_file.mtime_ns, file_size, None if content is None else content.decode("utf-8")]
+                if entry is not None:
+                    updated_cache[file_path] = entry
+            if content is None:
+                if file_size > maximum_bytes:
+                    skipped_for_size += 1
+                else:
+                    skipped_as_binary += 1
+                continue
+
+            included_count += 1
+            language_tag = LANG_FROM_EXTENSION.get(collected_file.suffix, "")
+
+            # Separate writes: the buffered writer coalesces them without copying content again.
+            write(f"===== FILE: {relative_path} =====\n\n```{language_tag}\n".encode("utf-8"))
+            write(content)
+            write(b"\n```\n\n")
+
+        counts = CollationCounts(included_count, skipped_for_size, skipped_as_binary)
+        write(collation_footer(counts).encode("utf-8"))
+
+    return counts, updated_cache
+
+def partition_by_top_level_dir(collected_files: list[CollectedFile]) -> dict[str, list[CollectedFile]]:
+    """
+    Group files by their first directory under the root, keeping the sorted order within each group.
+    Files directly under the root are keyed by "", which no directory can be named.
+    """
+    partitions: dict[str, list[CollectedFile]] = {}
+    for collected_file in collected_files:
+        top_level, separator, _ = collected_file.relative_path.partition(os.sep)
+        key = top_level if separator else ""
+        partitions.setdefault(key, []).append(collected_file)
+    return dict(sorted(partitions.items(), key=lambda item: item[0].lower()))
+
+def partition_names(partitions: dict[str, list[CollectedFile]]) -> dict[str, str]:
+    """Output name per partition key; the root partition gets ROOT_PARTITION, underscored until unique."""
+    names = {key: key for key in partitions if key}
+    if "" in partitions:
+        # Compared case-insensitively so the output names stay distinct on case-insensitive filesystems.
+        taken = {name.lower() for name in names.values()}
+        root_name = ROOT_PARTITION
+        while root_name.lower() in taken:
+            root_name = f"_{root_name}"
+        names[""] = root_name
+    return names
+
+def partition_output_path(output_file: Path, partition: str) -> Path:
+    return output_file.with_name(f"{output_file.stem}.{partition}{output_file.suffix}")
+
+def write_partition_index(
+    output_file: Path,
+    project_root: Path,
+    max_kb: int,
+    partitions: dict[str, list[CollectedFile]],
+    names: dict[str, str],
+    partition_files: dict[str, Path],
+    counts: CollationCounts,
+) -> None:
+    file_count = sum(len(files) for files in partitions.values())
+    partition_list = "".join(
+        f"- [`{names[key]}`]({partition_files[key].name}) ({len(files)} file{'' if len(files) == 1 else 's'})\n"
+        for key, files in partitions.items()
+    )
+    index = collation_header(project_root, file_count, max_kb, "Partitions") + partition_list + collation_footer(counts)
+    with atomic_output(output_file) as output_stream:
+        output_stream.write(index.encode("utf-8"))
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Collate a project into a single Markdown file with per-file sections."
@@ -197,7 +560,25 @@ def main() -> int:
         default=[],
         help="If supplied, only include these extensions (e.g. --only-exts .gd .rs .toml).",
     )
+    parser.add_argument(
+        "--read-workers",
+        type=int,
+        default=DEFAULT_READ_WORKERS,
+        help=f"Files read concurrently; raise for network filesystems (default: {DEFAULT_READ_WORKERS}).",
+    )
+    parser.add_argument(
+        "--split",
+        action="store_true",
+        help="Write one Markdown file per top-level directory plus an index at --output (default: off).",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse file contents from a cache next to the output when mtime and size are unchanged (default: off).",
+    )
     args = parser.parse_args()
+    if args.read_workers < 1:
+        parser.error("--read-workers must be at least 1")
 
     project_root = Path(args.root).resolve()
     output_file = Path(args.output).resolve()
@@ -214,67 +595,77 @@ def main() -> int:
         print(f"Error: root directory not found: {project_root}", file=sys.stderr)
         return 1
 
-    collected_paths = walk_project(
+    collected_files = walk_project(
         root_dir=project_root,
         excluded_directories=excluded_directories,
         allowed_extensions=allowed_extensions,
         include_hidden=args.include_hidden,
     )
 
-    lines: list[str] = []
-    lines.append("# Project Context Collation\n")
-    lines.append(f"- Root: `{project_root}`")
-    lines.append(f"- File count scanned (pre-size/binary filter): {len(collected_paths)}")
-    lines.append(f"- Max file size included: {args.max_kb} KB")
-    lines.append("")
-    lines.append("## Table of Contents")
-    lines.append("")
+    # Don't pull the previous run's output (or its cache) into the new collation.
+    cache_file = cache_path_for(output_file)
+    collected_files = [f for f in collected_files if f.path not in (str(output_file), str(cache_file))]
+    if args.split:
+        # Likewise skip earlier copies of exactly the partition files this run writes.
+        partition_paths = {
+            str(partition_output_path(output_file, name))
+            for name in partition_names(partition_by_top_level_dir(collected_files)).values()
+        }
+        collected_files = [f for f in collected_files if f.path not in partition_paths]
 
-    for path in collected_paths:
-        try:
-            file_size = path.stat().st_size
-            rel = path.relative_to(project_root)
-            lines.append(f"- `{rel}` ({human_kilobytes(file_size)})")
-        except Exception:
-            continue
-    lines.append("\n---\n")
+    cache = load_cache(cache_file, maximum_bytes) if args.cache else None
 
-    included_count = 0
-    skipped_for_size = 0
-    skipped_as_binary = 0
+    if not args.split:
+        counts, updated_cache = write_collation(
+            output_file,
+            project_root,
+            collected_files,
+            max_kb=args.max_kb,
+            cache=cache,
+            read_workers=args.read_workers,
+        )
+        created_files = [output_file]
+    else:
+        partitions = partition_by_top_level_dir(collected_files)
+        names = partition_names(partitions)
+        partition_files = {key: partition_output_path(output_file, names[key]) for key in partitions}
+        tasks = [
+            (
+                partition_files[key],
+                project_root,
+                files,
+                args.max_kb,
+                None if cache is None else {f.path: cache[f.path] for f in files if f.path in cache},
+                args.read_workers,
+            )
+            for key, files in partitions.items()
+        ]
+        with multiprocessing.Pool(processes=max(1, min(len(tasks), os.cpu_count() or 1))) as pool:
+            results = pool.starmap(write_collation, tasks)
 
-    for file_path in collected_paths:
-        relative_path = file_path.relative_to(project_root)
-        content = read_text_safely(file_path, max_bytes=maximum_bytes)
-        if content is None:
-            try:
-                if file_path.stat().st_size > maximum_bytes:
-                    skipped_for_size += 1
-                else:
-                    skipped_as_binary += 1
-            except Exception:
-                skipped_as_binary += 1
-            continue
-
-        included_count += 1
-        language_tag = infer_lang_from_extension(file_path)
-
-        lines.append(f"===== FILE: {relative_path} =====\n")
-        if language_tag:
-            lines.append(f"```{language_tag}")
-        else:
-            lines.append("```")
-        lines.append(content.rstrip("\n"))
-        lines.append("```\n")
-
-    lines.append("\n---")
-    lines.append(f"Included files: {included_count}")
-    lines.append(f"Skipped (too large): {skipped_for_size}")
-    lines.append(f"Skipped (binary/non-text): {skipped_as_binary}")
-    lines.append("")
-
-    output_file.write_text("\n".join(lines), encoding="utf-8")
-    print(f"Created: {output_file}")
+        counts = CollationCounts(
+            included=sum(c.included for c, _ in results),
+            skipped_for_size=sum(c.skipped_for_size for c, _ in results),
+            skipped_as_binary=sum(c.skipped_as_binary for c, _ in results),
+        )
+        updated_cache = {}
+        for _, partition_cache in results:
+            updated_cache.update(partition_cache)
+        write_partition_index(
+            output_file,
+            project_root,
+            max_kb=args.max_kb,
+            partitions=partitions,
+            names=names,
+            partition_files=partition_files,
+            counts=counts,
+        )
+        created_files = [output_file, *partition_files.values()]
+
+    if cache is not None:
+        save_cache(cache_file, maximum_bytes, updated_cache)
+    for created_file in created_files:
+        print(f"Created: {created_file}")
     return 0
 
 if __name__ == "__main__":